@@ -2,6 +2,8 @@ from config.settings import BaseAppSettings
 from config.dependencies import (
     get_settings,
     get_jwt_auth_manager,
+    get_current_user_id,
     get_accounts_email_notificator,
-    get_s3_storage_client
+    get_s3_storage_client,
+    create_s3_storage_client
 )
@@ -1,9 +1,11 @@
 import os
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Request, status
 
 from config.settings import TestingSettings, Settings, BaseAppSettings
+from exceptions import BaseSecurityError
 from notifications import EmailSenderInterface, EmailSender
+from security.http import get_token
 from security.interfaces import JWTAuthManagerInterface
 from security.token_manager import JWTAuthManager
 from storages import S3StorageInterface, S3StorageClient
@@ -49,6 +51,41 @@ def get_jwt_auth_manager(settings: BaseAppSettings = Depends(get_settings)) -> J
     )
 
 
+def get_current_user_id(
+    request: Request,
+    token: str = Depends(get_token),
+    jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager)
+) -> int:
+    """
+    Retrieve the ID of the user the request's access token belongs to.
+
+    The access token is decoded at most once per request: the decoded claims are stored on
+    `request.state.jwt_claims` and reused by any later dependency or middleware that needs them.
+
+    Args:
+        request (Request): The incoming request.
+        token (str): The Bearer token extracted from the Authorization header.
+        jwt_manager (JWTAuthManagerInterface): The JWT manager used to decode the token.
+
+    Returns:
+        int: The `user_id` claim of the access token.
+
+    Raises:
+        HTTPException: 401 Unauthorized if the token is invalid or expired.
+    """
+    claims = getattr(request.state, "jwt_claims", None)
+    if claims is None:
+        try:
+            claims = jwt_manager.decode_access_token(token)
+        except BaseSecurityError as error:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=str(error)
+            )
+        request.state.jwt_claims = claims
+    return claims.get("user_id")
+
+
 def get_accounts_email_notificator(
     settings: BaseAppSettings = Depends(get_settings)
 ) -> EmailSenderInterface:
@@ -80,22 +117,16 @@ def get_accounts_email_notificator(
     )
 
 
-def get_s3_storage_client(
-    settings: BaseAppSettings = Depends(get_settings)
-) -> S3StorageInterface:
+def create_s3_storage_client(settings: BaseAppSettings) -> S3StorageClient:
     """
-    Retrieve an instance of the S3StorageInterface configured with the application settings.
-
-    This function instantiates an S3StorageClient using the provided settings, which include the S3 endpoint URL,
-    access credentials, and the bucket name. The returned client can be used to interact with an S3-compatible
-    storage service for file uploads and URL generation.
+    Create an S3StorageClient configured with the application settings.
 
     Args:
-        settings (BaseAppSettings, optional): The application settings,
-        provided via dependency injection from `get_settings`.
+        settings (BaseAppSettings): The application settings providing the S3 endpoint URL,
+        access credentials and the bucket name.
 
     Returns:
-        S3StorageInterface: An instance of S3StorageClient configured with the appropriate S3 storage settings.
+        S3StorageClient: A new client with its own pool of keep-alive connections.
     """
     return S3StorageClient(
         endpoint_url=settings.S3_STORAGE_ENDPOINT,
@@ -103,3 +134,19 @@ def get_s3_storage_client(
         secret_key=settings.S3_STORAGE_SECRET_KEY,
         bucket_name=settings.S3_BUCKET_NAME
     )
+
+
+def get_s3_storage_client(request: Request) -> S3StorageInterface:
+    """
+    Retrieve the application-wide instance of the S3StorageInterface.
+
+    The client is created on startup and closed on shutdown by the application lifespan, so every request
+    shares it and its pool of keep-alive connections.
+
+    Args:
+        request (Request): The incoming request, used to reach the application state.
+
+    Returns:
+        S3StorageInterface: The shared S3StorageClient configured with the appropriate S3 storage settings.
+    """
+    return request.app.state.s3_storage_client
@@ -21,6 +21,7 @@ from database.models.movies import (
     MoviesLanguagesModel
 )
 from database.session_sqlite import reset_sqlite_database as reset_database
+from database.utils import dialect_insert
 from database.validators import accounts as accounts_validators
 
 environment = os.getenv("ENVIRONMENT", "developing")
@@ -97,6 +97,9 @@ class UserModel(Base):
     def has_group(self, group_name: UserGroupEnum) -> bool:
         return self.group.name == group_name
 
+    def has_any_group(self, *group_names: UserGroupEnum) -> bool:
+        return self.group.name in group_names
+
     @classmethod
     def create(cls, email: str, raw_password: str, group_id: int | Mapped[int]) -> "UserModel":
         """
@@ -46,7 +46,7 @@ class CSVDatabaseSeeder:
         :return: True if there's already at least one movie in the database, otherwise False.
         """
         result = await self._db_session.execute(select(MovieModel).limit(1))
-        first_movie = result.scalars().first()
+        first_movie = result.scalar_one_or_none()
         return first_movie is not None
 
     def _preprocess_csv(self) -> pd.DataFrame:
@@ -0,0 +1,28 @@
+from typing import Type
+
+from sqlalchemy import Insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models.base import Base
+
+
+def dialect_insert(session: AsyncSession, model: Type[Base]) -> Insert:
+    """
+    Build an INSERT construct for the dialect the session is bound to.
+
+    The dialect-specific constructs support `on_conflict_do_nothing()` / `on_conflict_do_update()`,
+    which the generic `sqlalchemy.insert` does not. PostgreSQL is used in development and production,
+    SQLite in tests.
+
+    :param session: The async database session the statement will be executed with.
+    :param model: The ORM model to insert into.
+    :return: A PostgreSQL or SQLite INSERT construct for the model.
+    :raises NotImplementedError: If the session is bound to any other dialect.
+    """
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        return postgresql.insert(model)
+    if dialect_name == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(f"INSERT ... ON CONFLICT is not supported for the '{dialect_name}' dialect.")
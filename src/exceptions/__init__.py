@@ -9,6 +9,7 @@ from exceptions.storage import (
     S3ConnectionError,
     S3BucketNotFoundError,
     S3FileUploadError,
+    S3FileDeleteError,
     S3FileNotFoundError,
     S3PermissionError
 )
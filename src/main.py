@@ -1,14 +1,33 @@
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
 from fastapi import FastAPI
 
+from config import get_settings, create_s3_storage_client
 from routes import (
     movie_router,
     accounts_router,
     profiles_router
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """
+    Manage application-scoped resources: create the shared S3 storage client on startup
+    and close it on shutdown.
+    """
+    app.state.s3_storage_client = create_s3_storage_client(get_settings())
+    try:
+        yield
+    finally:
+        await app.state.s3_storage_client.close()
+
+
 app = FastAPI(
     title="Movies homework",
-    description="Description of project"
+    description="Description of project",
+    lifespan=lifespan
 )
 
 api_version_prefix = "/api/v1"
@@ -90,18 +90,18 @@ async def register_user(
             - 409 Conflict if a user with the same email exists.
             - 500 Internal Server Error if an error occurs during user creation.
     """
-    stmt = select(UserModel).where(UserModel.email == user_data.email)
+    stmt = select(UserModel).where(UserModel.email == user_data.email).limit(1)
     result = await db.execute(stmt)
-    existing_user = result.scalars().first()
+    existing_user = result.scalar_one_or_none()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"A user with this email {user_data.email} already exists."
         )
 
-    stmt = select(UserGroupModel).where(UserGroupModel.name == UserGroupEnum.USER)
+    stmt = select(UserGroupModel).where(UserGroupModel.name == UserGroupEnum.USER).limit(1)
     result = await db.execute(stmt)
-    user_group = result.scalars().first()
+    user_group = result.scalar_one_or_none()
     if not user_group:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -203,9 +203,10 @@ async def activate_account(
             UserModel.email == activation_data.email,
             ActivationTokenModel.token == activation_data.token
         )
+        .limit(1)
     )
     result = await db.execute(stmt)
-    token_record = result.scalars().first()
+    token_record = result.scalar_one_or_none()
 
     now_utc = datetime.now(timezone.utc)
     if not token_record or cast(datetime, token_record.expires_at).replace(tzinfo=timezone.utc) < now_utc:
@@ -267,9 +268,9 @@ async def request_password_reset_token(
     Returns:
         MessageResponseSchema: A success message indicating that instructions will be sent.
     """
-    stmt = select(UserModel).filter_by(email=data.email)
+    stmt = select(UserModel).filter_by(email=data.email).limit(1)
     result = await db.execute(stmt)
-    user = result.scalars().first()
+    user = result.scalar_one_or_none()
 
     if not user or not user.is_active:
         return MessageResponseSchema(
@@ -362,18 +363,18 @@ async def reset_password(
             - 400 Bad Request if the email or token is invalid, or the token has expired.
             - 500 Internal Server Error if an error occurs during the password reset process.
     """
-    stmt = select(UserModel).filter_by(email=data.email)
+    stmt = select(UserModel).filter_by(email=data.email).limit(1)
     result = await db.execute(stmt)
-    user = result.scalars().first()
+    user = result.scalar_one_or_none()
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email or token."
         )
 
-    stmt = select(PasswordResetTokenModel).filter_by(user_id=user.id)
+    stmt = select(PasswordResetTokenModel).filter_by(user_id=user.id).limit(1)
     result = await db.execute(stmt)
-    token_record = result.scalars().first()
+    token_record = result.scalar_one_or_none()
 
     if not token_record or token_record.token != data.token:
         if token_record:
@@ -479,9 +480,9 @@ async def login_user(
             - 403 Forbidden if the user account is not activated.
             - 500 Internal Server Error if an error occurs during token creation.
     """
-    stmt = select(UserModel).filter_by(email=login_data.email)
+    stmt = select(UserModel).filter_by(email=login_data.email).limit(1)
     result = await db.execute(stmt)
-    user = result.scalars().first()
+    user = result.scalar_one_or_none()
 
     if not user or not user.verify_password(login_data.password):
         raise HTTPException(
@@ -593,18 +594,18 @@ async def refresh_access_token(
             detail=str(error),
         )
 
-    stmt = select(RefreshTokenModel).filter_by(token=token_data.refresh_token)
+    stmt = select(RefreshTokenModel).filter_by(token=token_data.refresh_token).limit(1)
     result = await db.execute(stmt)
-    refresh_token_record = result.scalars().first()
+    refresh_token_record = result.scalar_one_or_none()
     if not refresh_token_record:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token not found.",
         )
 
-    stmt = select(UserModel).filter_by(id=user_id)
+    stmt = select(UserModel).filter_by(id=user_id).limit(1)
     result = await db.execute(stmt)
-    user = result.scalars().first()
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
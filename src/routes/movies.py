@@ -153,9 +153,9 @@ async def create_movie(
     existing_stmt = select(MovieModel).where(
         (MovieModel.name == movie_data.name),
         (MovieModel.date == movie_data.date)
-    )
+    ).limit(1)
     existing_result = await db.execute(existing_stmt)
-    existing_movie = existing_result.scalars().first()
+    existing_movie = existing_result.scalar_one_or_none()
 
     if existing_movie:
         raise HTTPException(
@@ -167,9 +167,9 @@ async def create_movie(
         )
 
     try:
-        country_stmt = select(CountryModel).where(CountryModel.code == movie_data.country)
+        country_stmt = select(CountryModel).where(CountryModel.code == movie_data.country).limit(1)
         country_result = await db.execute(country_stmt)
-        country = country_result.scalars().first()
+        country = country_result.scalar_one_or_none()
         if not country:
             country = CountryModel(code=movie_data.country)
             db.add(country)
@@ -177,9 +177,9 @@ async def create_movie(
 
         genres = []
         for genre_name in movie_data.genres:
-            genre_stmt = select(GenreModel).where(GenreModel.name == genre_name)
+            genre_stmt = select(GenreModel).where(GenreModel.name == genre_name).limit(1)
             genre_result = await db.execute(genre_stmt)
-            genre = genre_result.scalars().first()
+            genre = genre_result.scalar_one_or_none()
 
             if not genre:
                 genre = GenreModel(name=genre_name)
@@ -189,9 +189,9 @@ async def create_movie(
 
         actors = []
         for actor_name in movie_data.actors:
-            actor_stmt = select(ActorModel).where(ActorModel.name == actor_name)
+            actor_stmt = select(ActorModel).where(ActorModel.name == actor_name).limit(1)
             actor_result = await db.execute(actor_stmt)
-            actor = actor_result.scalars().first()
+            actor = actor_result.scalar_one_or_none()
 
             if not actor:
                 actor = ActorModel(name=actor_name)
@@ -201,9 +201,9 @@ async def create_movie(
 
         languages = []
         for language_name in movie_data.languages:
-            lang_stmt = select(LanguageModel).where(LanguageModel.name == language_name)
+            lang_stmt = select(LanguageModel).where(LanguageModel.name == language_name).limit(1)
             lang_result = await db.execute(lang_stmt)
-            language = lang_result.scalars().first()
+            language = lang_result.scalar_one_or_none()
 
             if not language:
                 language = LanguageModel(name=language_name)
@@ -288,7 +288,7 @@ async def get_movie_by_id(
     )
 
     result = await db.execute(stmt)
-    movie = result.scalars().first()
+    movie = result.unique().scalar_one_or_none()
 
     if not movie:
         raise HTTPException(
@@ -342,9 +342,9 @@ async def delete_movie(
     :return: A response indicating the successful deletion of the movie.
     :rtype: None
     """
-    stmt = select(MovieModel).where(MovieModel.id == movie_id)
+    stmt = select(MovieModel).where(MovieModel.id == movie_id).limit(1)
     result = await db.execute(stmt)
-    movie = result.scalars().first()
+    movie = result.scalar_one_or_none()
 
     if not movie:
         raise HTTPException(
@@ -408,9 +408,9 @@ async def update_movie(
     :return: A response indicating the successful update of the movie.
     :rtype: None
     """
-    stmt = select(MovieModel).where(MovieModel.id == movie_id)
+    stmt = select(MovieModel).where(MovieModel.id == movie_id).limit(1)
     result = await db.execute(stmt)
-    movie = result.scalars().first()
+    movie = result.scalar_one_or_none()
 
     if not movie:
         raise HTTPException(
@@ -1,21 +1,72 @@
-from typing import cast
+import asyncio
+import hashlib
+import os
+from contextlib import suppress
+from typing import BinaryIO, List, Optional
 
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, status, HTTPException, Response
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from config import get_jwt_auth_manager, get_s3_storage_client
-from database import get_db, UserModel, UserProfileModel, UserGroupEnum
-from database.models.accounts import GenderEnum
-from exceptions import BaseSecurityError, S3FileUploadError
-from schemas.profiles import ProfileCreateRequestSchema, ProfileResponseSchema
-from security.http import get_token
-from security.interfaces import JWTAuthManagerInterface
+from config import get_current_user_id, get_s3_storage_client
+from database import get_db, dialect_insert, UserModel, UserProfileModel, UserGroupEnum
+from exceptions import BaseS3Error
+from schemas.profiles import (
+    ProfileCreateRequestSchema,
+    ProfileBatchCreateRequestSchema,
+    ProfileResponseSchema
+)
 from storages import S3StorageInterface
 
 router = APIRouter()
 
+PRIVILEGED_GROUPS = (UserGroupEnum.ADMIN, UserGroupEnum.MODERATOR)
+AVATAR_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png"})
+AVATAR_HASH_CHUNK_SIZE = 64 * 1024
+BATCH_UPLOAD_CONCURRENCY = 20
+
+profile_list_adapter = TypeAdapter(List[ProfileResponseSchema])
+
+
+def _build_avatar_key(user_id: int, avatar_file: BinaryIO, filename: Optional[str]) -> str:
+    """
+    Build the storage key for an avatar from the SHA-256 digest of its content.
+
+    The client-supplied filename only contributes a whitelisted extension, so it never ends up in the key;
+    identical uploads for the same user map to the same object.
+    """
+    digest = hashlib.sha256()
+    avatar_file.seek(0)
+    for chunk in iter(lambda: avatar_file.read(AVATAR_HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    avatar_file.seek(0)
+
+    extension = os.path.splitext(filename or "")[1].lower()
+    if extension not in AVATAR_EXTENSIONS:
+        extension = ""
+    return f"avatars/{user_id}/{digest.hexdigest()[:32]}{extension}"
+
+
+async def _discard_uploaded_avatars(
+    db: AsyncSession,
+    s3_client: S3StorageInterface,
+    avatar_keys: List[str]
+) -> None:
+    """
+    Delete avatars uploaded for a rejected request, except those a stored profile already references.
+    """
+    stmt = select(UserProfileModel.avatar).where(UserProfileModel.avatar.in_(avatar_keys))
+    result = await db.execute(stmt)
+    referenced_keys = set(result.scalars().all())
+
+    async def delete(avatar_key: str) -> None:
+        with suppress(BaseS3Error):
+            await s3_client.delete_file(avatar_key)
+
+    await asyncio.gather(*(delete(key) for key in avatar_keys if key not in referenced_keys))
+
 
 @router.post(
     "/users/{user_id}/profile/",
@@ -25,24 +76,140 @@ router = APIRouter()
 )
 async def create_user_profile(
     user_id: int,
-    token: str = Depends(get_token),
-    jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+    requesting_user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db),
     s3_client: S3StorageInterface = Depends(get_s3_storage_client),
     profile_data: ProfileCreateRequestSchema = Depends(ProfileCreateRequestSchema.as_form),
-) -> ProfileResponseSchema:
+) -> Response:
+    avatar_key = await asyncio.to_thread(
+        _build_avatar_key, user_id, profile_data.avatar.file, profile_data.avatar.filename
+    )
+
+    # Only overlap the upload with the lookups when users write their own profile: an
+    # avatar for someone else's profile must not reach storage before permissions are checked.
+    upload_task = None
+    if requesting_user_id == user_id:
+        upload_task = asyncio.create_task(s3_client.upload_file(avatar_key, profile_data.avatar.file))
+
+    try:
+        stmt = (
+            select(UserModel)
+            .options(joinedload(UserModel.group))
+            .where(UserModel.id.in_({requesting_user_id, user_id}))
+        )
+        result = await db.execute(stmt)
+        users = {user.id: user for user in result.scalars().all()}
+        requesting_user = users.get(requesting_user_id)
+
+        if not requesting_user or not requesting_user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found or not active."
+            )
+
+        if requesting_user_id != user_id and not requesting_user.has_any_group(*PRIVILEGED_GROUPS):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to edit this profile."
+            )
+
+        target_user = requesting_user if requesting_user_id == user_id else users.get(user_id)
+
+        if not target_user or not target_user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found or not active."
+            )
+    except BaseException as error:
+        if upload_task:
+            upload_task.cancel()
+            await asyncio.wait([upload_task])
+            if not upload_task.cancelled():
+                upload_task.exception()
+            # The key is derived from the content, so it may belong to an existing profile. Without a
+            # usable session the references cannot be checked: leave the object rather than risk it.
+            if isinstance(error, HTTPException):
+                await _discard_uploaded_avatars(db, s3_client, [avatar_key])
+        raise
+
     try:
-        decoded_token = jwt_manager.decode_access_token(token)
-        requesting_user_id = decoded_token.get("user_id")
-    except BaseSecurityError as error:
+        if upload_task:
+            await upload_task
+        else:
+            await s3_client.upload_file(avatar_key, profile_data.avatar.file)
+    except BaseS3Error:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(error)
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to upload avatar. Please try again later."
         )
 
-    stmt = select(UserModel).options(joinedload(UserModel.group)).where(UserModel.id == requesting_user_id)
+    avatar_url = s3_client.build_url(avatar_key)
+
+    profile_row = {
+        "user_id": user_id,
+        "first_name": profile_data.first_name,
+        "last_name": profile_data.last_name,
+        "gender": profile_data.gender,
+        "date_of_birth": profile_data.date_of_birth,
+        "info": profile_data.info,
+        "avatar": avatar_key,
+    }
+    stmt = (
+        dialect_insert(db, UserProfileModel)
+        .values(**profile_row)
+        .on_conflict_do_nothing(index_elements=[UserProfileModel.user_id])
+        .returning(UserProfileModel.id)
+    )
     result = await db.execute(stmt)
-    requesting_user = result.scalars().first()
+    profile_id = result.scalar_one_or_none()
+
+    if profile_id is None:
+        await db.rollback()
+        await _discard_uploaded_avatars(db, s3_client, [avatar_key])
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User already has a profile."
+        )
+
+    await db.commit()
+
+    response_data = ProfileResponseSchema.model_construct(
+        id=profile_id,
+        user_id=user_id,
+        first_name=profile_data.first_name,
+        last_name=profile_data.last_name,
+        gender=profile_data.gender,
+        date_of_birth=profile_data.date_of_birth,
+        info=profile_data.info,
+        avatar=avatar_url
+    )
+    return Response(
+        content=response_data.model_dump_json(),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
+
+
+@router.post(
+    "/users/profiles/batch/",
+    response_model=List[ProfileResponseSchema],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create User Profiles in Batch",
+)
+async def create_user_profiles_batch(
+    requesting_user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+    s3_client: S3StorageInterface = Depends(get_s3_storage_client),
+    batch_data: ProfileBatchCreateRequestSchema = Depends(ProfileBatchCreateRequestSchema.as_form),
+) -> Response:
+    stmt = (
+        select(UserModel)
+        .options(joinedload(UserModel.group))
+        .where(UserModel.id.in_({requesting_user_id, *batch_data.user_ids}))
+    )
+    result = await db.execute(stmt)
+    users = {user.id: user for user in result.scalars().all()}
+    requesting_user = users.get(requesting_user_id)
 
     if not requesting_user or not requesting_user.is_active:
         raise HTTPException(
@@ -50,61 +217,99 @@ async def create_user_profile(
             detail="User not found or not active."
         )
 
-    is_privileged = (requesting_user.has_group(UserGroupEnum.ADMIN)
-                     or requesting_user.has_group(UserGroupEnum.MODERATOR))
-    if requesting_user_id != user_id and not is_privileged:
+    if not requesting_user.has_any_group(*PRIVILEGED_GROUPS):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to edit this profile."
+            detail="You don't have permission to edit these profiles."
         )
 
-    stmt = select(UserModel).where(UserModel.id == user_id)
-    result = await db.execute(stmt)
-    target_user = result.scalars().first()
-
-    if not target_user or not target_user.is_active:
+    unavailable_ids = [
+        user_id for user_id in batch_data.user_ids
+        if user_id not in users or not users[user_id].is_active
+    ]
+    if unavailable_ids:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found or not active."
+            detail=f"Users not found or not active: {unavailable_ids}."
         )
 
-    stmt = select(UserProfileModel).where(UserProfileModel.user_id == user_id)
-    result = await db.execute(stmt)
-    existing_profile = result.scalars().first()
+    avatar_keys = await asyncio.gather(*(
+        asyncio.to_thread(_build_avatar_key, user_id, profile.avatar.file, profile.avatar.filename)
+        for user_id, profile in zip(batch_data.user_ids, batch_data.profiles)
+    ))
 
-    if existing_profile:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User already has a profile."
-        )
+    semaphore = asyncio.Semaphore(BATCH_UPLOAD_CONCURRENCY)
 
-    try:
-        avatar_contents = await profile_data.avatar.read()
-        avatar_key = f"avatars/{user_id}_{profile_data.avatar.filename}"
+    async def upload(avatar_key: str, avatar_file: BinaryIO) -> None:
+        async with semaphore:
+            await s3_client.upload_file(avatar_key, avatar_file)
 
-        await s3_client.upload_file(avatar_key, avatar_contents)
-        avatar_url = await s3_client.get_file_url(avatar_key)
-    except (S3FileUploadError, Exception):
+    upload_results = await asyncio.gather(
+        *(upload(key, profile.avatar.file) for key, profile in zip(avatar_keys, batch_data.profiles)),
+        return_exceptions=True
+    )
+    upload_errors = [error for error in upload_results if isinstance(error, BaseException)]
+    if upload_errors:
+        uploaded_keys = [
+            key for key, outcome in zip(avatar_keys, upload_results)
+            if not isinstance(outcome, BaseException)
+        ]
+        await _discard_uploaded_avatars(db, s3_client, uploaded_keys)
+        for error in upload_errors:
+            if not isinstance(error, BaseS3Error):
+                raise error
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to upload avatar. Please try again later."
+            detail="Failed to upload avatars. Please try again later."
         )
 
-    new_profile = UserProfileModel(
-        user_id=user_id,
-        first_name=profile_data.first_name,
-        last_name=profile_data.last_name,
-        gender=GenderEnum(profile_data.gender),
-        date_of_birth=profile_data.date_of_birth,
-        info=profile_data.info,
-        avatar=avatar_key
+    profile_rows = [
+        {
+            "user_id": user_id,
+            "first_name": profile.first_name,
+            "last_name": profile.last_name,
+            "gender": profile.gender,
+            "date_of_birth": profile.date_of_birth,
+            "info": profile.info,
+            "avatar": avatar_key,
+        }
+        for user_id, profile, avatar_key in zip(batch_data.user_ids, batch_data.profiles, avatar_keys)
+    ]
+    stmt = (
+        dialect_insert(db, UserProfileModel)
+        .values(profile_rows)
+        .on_conflict_do_nothing(index_elements=[UserProfileModel.user_id])
+        .returning(UserProfileModel.user_id, UserProfileModel.id)
     )
+    result = await db.execute(stmt)
+    profile_ids = dict(result.tuples().all())
 
-    db.add(new_profile)
-    await db.commit()
-    await db.refresh(new_profile)
+    if len(profile_ids) != len(profile_rows):
+        await db.rollback()
+        await _discard_uploaded_avatars(db, s3_client, avatar_keys)
+        existing_ids = [user_id for user_id in batch_data.user_ids if user_id not in profile_ids]
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Users already have a profile: {existing_ids}."
+        )
 
-    response_data = ProfileResponseSchema.model_validate(new_profile)
-    response_data.avatar = avatar_url
+    await db.commit()
 
-    return response_data
+    response_data = [
+        ProfileResponseSchema.model_construct(
+            id=profile_ids[row["user_id"]],
+            user_id=row["user_id"],
+            first_name=row["first_name"],
+            last_name=row["last_name"],
+            gender=row["gender"],
+            date_of_birth=row["date_of_birth"],
+            info=row["info"],
+            avatar=s3_client.build_url(row["avatar"])
+        )
+        for row in profile_rows
+    ]
+    return Response(
+        content=profile_list_adapter.dump_json(response_data),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
@@ -1,16 +1,20 @@
+import asyncio
 from datetime import date
+from typing import List
 
 from fastapi import UploadFile, Form, File, HTTPException
-from pydantic import BaseModel, field_validator
-from pydantic_core import ValidationError
+from pydantic import BaseModel, model_validator
 
 from validation import (
     validate_name,
     validate_image,
     validate_gender,
-    validate_birth_date
+    validate_birth_date,
+    validate_info
 )
 
+MAX_BATCH_SIZE = 50
+
 
 class ProfileCreateRequestSchema(BaseModel):
     first_name: str
@@ -21,7 +25,7 @@ class ProfileCreateRequestSchema(BaseModel):
     avatar: UploadFile
 
     @classmethod
-    def as_form(
+    async def as_form(
         cls,
         first_name: str = Form(...),
         last_name: str = Form(...),
@@ -31,49 +35,94 @@ class ProfileCreateRequestSchema(BaseModel):
         avatar: UploadFile = File(...)
     ) -> "ProfileCreateRequestSchema":
         try:
-            return cls(
-                first_name=first_name,
-                last_name=last_name,
-                gender=gender,
-                date_of_birth=date_of_birth,
-                info=info,
-                avatar=avatar
-            )
-        except ValidationError as e:
-            error_msg = str(e.errors()[0]['msg'])
-            raise HTTPException(status_code=422, detail=error_msg)
+            return await cls.from_values(first_name, last_name, gender, date_of_birth, info, avatar)
+        except ValueError as error:
+            raise HTTPException(status_code=422, detail=str(error))
 
-    @field_validator("first_name", "last_name")
     @classmethod
-    def validate_name_field(cls, name: str) -> str:
-        validate_name(name)
-        return name.lower()
+    async def from_values(
+        cls,
+        first_name: str,
+        last_name: str,
+        gender: str,
+        date_of_birth: date,
+        info: str,
+        avatar: UploadFile
+    ) -> "ProfileCreateRequestSchema":
+        fields = cls.clean_fields(first_name, last_name, gender, date_of_birth, info)
+        await asyncio.to_thread(validate_image, avatar.file, avatar.size)
+        return cls.model_construct(**fields, avatar=avatar)
 
-    @field_validator("avatar")
-    @classmethod
-    def validate_avatar(cls, avatar: UploadFile) -> UploadFile:
-        validate_image(avatar)
-        return avatar
+    @staticmethod
+    def clean_fields(first_name: str, last_name: str, gender: str, date_of_birth: date, info: str) -> dict:
+        """
+        Validate the text and date fields of a profile and return them normalised.
 
-    @field_validator("gender")
-    @classmethod
-    def validate_gender_field(cls, gender: str) -> str:
+        Shared by `from_values` and the model validator so both paths apply the same checks.
+        The avatar is validated separately by each caller.
+        """
+        validate_name(first_name)
+        validate_name(last_name)
         validate_gender(gender)
-        return gender
-
-    @field_validator("date_of_birth")
-    @classmethod
-    def validate_date_of_birth(cls, date_of_birth: date) -> date:
         validate_birth_date(date_of_birth)
-        return date_of_birth
+        validate_info(info)
+        return {
+            "first_name": first_name.lower(),
+            "last_name": last_name.lower(),
+            "gender": gender,
+            "date_of_birth": date_of_birth,
+            "info": info.strip(),
+        }
+
+    @model_validator(mode="after")
+    def validate_profile(self) -> "ProfileCreateRequestSchema":
+        """
+        Validate a directly constructed schema.
+
+        The avatar is inspected synchronously here; request handlers go through `from_values`,
+        which offloads it to a worker thread instead.
+        """
+        fields = self.clean_fields(self.first_name, self.last_name, self.gender, self.date_of_birth, self.info)
+        validate_image(self.avatar.file, self.avatar.size)
+        for name, value in fields.items():
+            setattr(self, name, value)
+        return self
+
+
+class ProfileBatchCreateRequestSchema(BaseModel):
+    user_ids: List[int]
+    profiles: List[ProfileCreateRequestSchema]
 
-    @field_validator("info")
     @classmethod
-    def validate_info(cls, info: str) -> str:
-        cleaned_info = info.strip()
-        if not cleaned_info:
-            raise ValueError("Info field cannot be empty or contain only spaces.")
-        return cleaned_info
+    async def as_form(
+        cls,
+        user_id: List[int] = Form(...),
+        first_name: List[str] = Form(...),
+        last_name: List[str] = Form(...),
+        gender: List[str] = Form(...),
+        date_of_birth: List[date] = Form(...),
+        info: List[str] = Form(...),
+        avatar: List[UploadFile] = File(...)
+    ) -> "ProfileBatchCreateRequestSchema":
+        fields = (user_id, first_name, last_name, gender, date_of_birth, info, avatar)
+        if len({len(values) for values in fields}) != 1:
+            raise HTTPException(status_code=422, detail="Every profile field must be provided once per user.")
+        if len(user_id) > MAX_BATCH_SIZE:
+            raise HTTPException(
+                status_code=422,
+                detail=f"A batch can contain at most {MAX_BATCH_SIZE} profiles."
+            )
+        if len(set(user_id)) != len(user_id):
+            raise HTTPException(status_code=422, detail="Each user can appear only once in a batch.")
+
+        try:
+            profiles = await asyncio.gather(
+                *(ProfileCreateRequestSchema.from_values(*values) for values in zip(*fields[1:]))
+            )
+        except ValueError as error:
+            raise HTTPException(status_code=422, detail=str(error))
+
+        return cls.model_construct(user_ids=user_id, profiles=profiles)
 
 
 class ProfileResponseSchema(BaseModel):
@@ -1,21 +1,39 @@
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import BinaryIO, Union
 
 
 class S3StorageInterface(ABC):
 
     @abstractmethod
-    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray]) -> None:
+    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray, BinaryIO]) -> None:
         """
         Uploads a file to the storage.
 
         :param file_name: The name of the file to be stored.
-        :param file_data: The file data in bytes.
+        :param file_data: The file data in bytes or a binary file-like object to stream from.
         :return: URL of the uploaded file.
         """
         pass
 
     @abstractmethod
+    async def delete_file(self, file_name: str) -> None:
+        """
+        Deletes a file from the storage.
+
+        :param file_name: The name of the file to be deleted.
+        """
+        pass
+
+    @abstractmethod
+    def build_url(self, file_name: str) -> str:
+        """
+        Build a public URL for a file stored in the S3-compatible storage without any I/O.
+
+        :param file_name: The name of the file stored in the bucket.
+        :return: The full URL to access the file.
+        """
+        pass
+
     async def get_file_url(self, file_name: str) -> str:
         """
         Generate a public URL for a file stored in the S3-compatible storage.
@@ -23,4 +41,10 @@ class S3StorageInterface(ABC):
         :param file_name: The name of the file stored in the bucket.
         :return: The full URL to access the file.
         """
+        return self.build_url(file_name)
+
+    async def close(self) -> None:
+        """
+        Release any resources held by the storage client, such as pooled connections.
+        """
         pass
@@ -1,14 +1,19 @@
-from typing import Union
+import asyncio
+from io import BytesIO
+from typing import BinaryIO, Union
+from urllib.parse import quote
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from botocore.exceptions import (
     BotoCoreError,
+    ClientError,
     NoCredentialsError,
     HTTPClientError,
     ConnectionError
 )
 
-from exceptions import S3ConnectionError, S3FileUploadError
+from exceptions import S3ConnectionError, S3FileUploadError, S3FileDeleteError
 from storages import S3StorageInterface
 
 
@@ -19,16 +24,21 @@ class S3StorageClient(S3StorageInterface):
         endpoint_url: str,
         access_key: str,
         secret_key: str,
-        bucket_name: str
+        bucket_name: str,
+        max_pool_connections: int = 50
     ):
         """
         Initialize the asynchronous S3 Storage Client using an aioboto3 Session.
 
+        The underlying S3 client is created on first use and kept open, so its HTTP connection
+        pool (and the TCP/TLS connections in it) is reused across requests until `close()` is called.
+
         Args:
             endpoint_url (str): S3-compatible storage endpoint.
             access_key (str): Access key for authentication.
             secret_key (str): Secret key for authentication.
             bucket_name (str): Name of the bucket where files will be stored.
+            max_pool_connections (int): Maximum number of pooled connections kept to the storage.
         """
         self._endpoint_url = endpoint_url
         self._access_key = access_key
@@ -39,37 +49,88 @@ class S3StorageClient(S3StorageInterface):
             aws_access_key_id=self._access_key,
             aws_secret_access_key=self._secret_key,
         )
+        self._config = AioConfig(max_pool_connections=max_pool_connections)
+        self._client_context = None
+        self._client = None
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self):
+        """
+        Return the shared S3 client, creating it on first use.
+        """
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client_context = self._session.client(
+                        "s3", endpoint_url=self._endpoint_url, config=self._config
+                    )
+                    self._client = await self._client_context.__aenter__()
+        return self._client
 
-    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray]) -> None:
+    async def close(self) -> None:
+        """
+        Close the shared S3 client and release its pooled connections.
+        """
+        if self._client_context is not None:
+            await self._client_context.__aexit__(None, None, None)
+            self._client_context = None
+            self._client = None
+
+    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray, BinaryIO]) -> None:
         """
         Asynchronously upload a file to the S3-compatible storage.
 
+        File-like objects are streamed in chunks via ``upload_fileobj``, so the whole
+        file never has to be held in memory; raw bytes are wrapped in a buffer first.
+
         Args:
             file_name (str): The name of the file to be stored.
-            file_data (Union[bytes, bytearray]): The file data in bytes.
+            file_data (Union[bytes, bytearray, BinaryIO]): The file data in bytes or a binary file-like object.
 
         Raises:
             S3ConnectionError: If there is a connection error with S3.
-            S3FileUploadError: If the file upload fails due to a BotoCore error.
+            S3FileUploadError: If the file upload fails due to a BotoCore error or an error response from S3.
         """
+        if isinstance(file_data, (bytes, bytearray)):
+            file_data = BytesIO(file_data)
+
         try:
-            async with self._session.client(
-                "s3", endpoint_url=self._endpoint_url
-            ) as client:
-                await client.put_object(
-                    Bucket=self._bucket_name,
-                    Key=file_name,
-                    Body=file_data,
-                    ContentType="image/jpeg"
-                )
+            client = await self._get_client()
+            await client.upload_fileobj(
+                file_data,
+                self._bucket_name,
+                file_name,
+                ExtraArgs={"ContentType": "image/jpeg"}
+            )
         except (ConnectionError, HTTPClientError, NoCredentialsError) as e:
             raise S3ConnectionError(f"Failed to connect to S3 storage: {str(e)}") from e
-        except BotoCoreError as e:
+        except (BotoCoreError, ClientError) as e:
             raise S3FileUploadError(f"Failed to upload to S3 storage: {str(e)}") from e
 
-    async def get_file_url(self, file_name: str) -> str:
+    async def delete_file(self, file_name: str) -> None:
         """
-        Generate a public URL for a file stored in the S3-compatible storage.
+        Asynchronously delete a file from the S3-compatible storage.
+
+        Args:
+            file_name (str): The name of the file to be deleted.
+
+        Raises:
+            S3ConnectionError: If there is a connection error with S3.
+            S3FileDeleteError: If the file deletion fails due to a BotoCore error or an error response from S3.
+        """
+        try:
+            client = await self._get_client()
+            await client.delete_object(Bucket=self._bucket_name, Key=file_name)
+        except (ConnectionError, HTTPClientError, NoCredentialsError) as e:
+            raise S3ConnectionError(f"Failed to connect to S3 storage: {str(e)}") from e
+        except (BotoCoreError, ClientError) as e:
+            raise S3FileDeleteError(f"Failed to delete from S3 storage: {str(e)}") from e
+
+    def build_url(self, file_name: str) -> str:
+        """
+        Build a public URL for a file stored in the S3-compatible storage.
+
+        The URL is composed locally from the endpoint, bucket and key, so no request to S3 is made.
 
         Args:
             file_name (str): The name of the file stored in the bucket.
@@ -77,4 +138,4 @@ class S3StorageClient(S3StorageInterface):
         Returns:
             str: The full URL to access the file.
         """
-        return f"{self._endpoint_url}/{self._bucket_name}/{file_name}"
+        return f"{self._endpoint_url}/{self._bucket_name}/{quote(file_name)}"
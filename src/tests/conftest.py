@@ -11,7 +11,7 @@ from database import (
     UserGroupModel
 )
 from database.populate import CSVDatabaseSeeder
-from main import app
+from main import app, lifespan
 from security.interfaces import JWTAuthManagerInterface
 from security.token_manager import JWTAuthManager
 from storages import S3StorageClient
@@ -124,10 +124,12 @@ async def e2e_client():
     """
     Provide an asynchronous HTTP client for end-to-end tests.
 
-    This client is available at the session scope.
+    This client is available at the session scope. The application lifespan is run around it,
+    since the ASGI transport does not send lifespan events.
     """
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as async_client:
-        yield async_client
+    async with lifespan(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as async_client:
+            yield async_client
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -1,4 +1,5 @@
-from typing import Dict, Union
+from typing import BinaryIO, Dict, Union
+from urllib.parse import quote
 
 from storages import S3StorageInterface
 
@@ -17,20 +18,30 @@ class FakeS3Storage(S3StorageInterface):
         """
         self.storage: Dict[str, bytes] = {}
 
-    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray]) -> None:
+    async def upload_file(self, file_name: str, file_data: Union[bytes, bytearray, BinaryIO]) -> None:
         """
         Simulates file upload to S3 by storing the file data in a dictionary.
 
         :param file_name: The name of the file to be stored.
-        :param file_data: The file data in bytes.
+        :param file_data: The file data in bytes or a binary file-like object.
         """
+        if not isinstance(file_data, (bytes, bytearray)):
+            file_data = file_data.read()
         self.storage[file_name] = file_data
 
-    async def get_file_url(self, file_name: str) -> str:
+    async def delete_file(self, file_name: str) -> None:
         """
-        Generates a fake URL for a stored file.
+        Simulates file deletion from S3 by removing the file data from the dictionary.
+
+        :param file_name: The name of the file to be deleted.
+        """
+        self.storage.pop(file_name, None)
+
+    def build_url(self, file_name: str) -> str:
+        """
+        Builds a fake URL for a stored file.
 
         :param file_name: The name of the file.
         :return: The full fake URL to access the file.
         """
-        return f"http://fake-s3.local/{file_name}"
+        return f"http://fake-s3.local/{quote(file_name)}"
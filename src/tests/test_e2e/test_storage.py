@@ -1,3 +1,4 @@
+import hashlib
 import aioboto3
 import pytest
 from io import BytesIO
@@ -64,7 +65,7 @@ async def test_create_user_profile(e2e_client, e2e_db_session, settings, s3_clie
     assert profile_data["date_of_birth"] == "1990-01-01"
     assert "avatar" in profile_data, "Avatar URL is missing!"
 
-    avatar_key = f"avatars/{user.id}_avatar.jpg"
+    avatar_key = f"avatars/{user.id}/{hashlib.sha256(img_bytes.getvalue()).hexdigest()[:32]}.jpg"
     expected_url = await s3_client.get_file_url(avatar_key)
     assert profile_data["avatar"] == expected_url, f"Invalid avatar URL: {profile_data['avatar']}"
 
@@ -1,13 +1,23 @@
-from datetime import datetime, timedelta
-from unittest.mock import patch
+import hashlib
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from io import BytesIO
 from PIL import Image
+from botocore.exceptions import ClientError
+from fastapi import Request, UploadFile
+from pydantic import ValidationError
 from sqlalchemy import select, func
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import get_s3_storage_client
 from database import UserModel, UserProfileModel
 from exceptions import S3FileUploadError
+from main import app, lifespan
+from schemas.profiles import MAX_BATCH_SIZE, ProfileCreateRequestSchema
+from storages import S3StorageClient
 
 
 @pytest.mark.asyncio
@@ -41,7 +51,7 @@ async def test_create_user_profile_with_fake_s3(
     img.save(img_bytes, format="JPEG")
     img_bytes.seek(0)
 
-    avatar_key = f"avatars/{user.id}_avatar.jpg"
+    avatar_key = f"avatars/{user.id}/{hashlib.sha256(img_bytes.getvalue()).hexdigest()[:32]}.jpg"
     profile_url = f"/api/v1/profiles/users/{user.id}/profile/"
     headers = {"Authorization": f"Bearer {access_token}"}
     files = {
@@ -191,7 +201,7 @@ async def test_admin_creates_user_profile(
     img.save(img_bytes, format="JPEG")
     img_bytes.seek(0)
 
-    avatar_key = f"avatars/{regular_user.id}_avatar.jpg"
+    avatar_key = f"avatars/{regular_user.id}/{hashlib.sha256(img_bytes.getvalue()).hexdigest()[:32]}.jpg"
     profile_url = f"/api/v1/profiles/users/{regular_user.id}/profile/"
     headers = {"Authorization": f"Bearer {admin_token}"}
     files = {
@@ -341,6 +351,98 @@ async def test_inactive_user_cannot_create_profile(
     result_profile = await db_session.execute(stmt_profile)
     profile_in_db = result_profile.scalars().first()
     assert profile_in_db is None, "Profile should not have been created!"
+    assert not s3_storage_fake.storage, "Avatar uploaded for a rejected request was not removed from storage!"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_profile_creation_db_error_keeps_original_error(
+        db_session, seed_user_groups, reset_db, jwt_manager, s3_storage_fake, client
+):
+    """
+    Test that a database failure during the profile lookups propagates unchanged and that the failed
+    session is not queried again to clean up the avatar uploaded concurrently.
+    """
+    user = UserModel.create(email="test@mate.com", raw_password="TestPassword123!", group_id=1)
+    user.is_active = True
+    db_session.add(user)
+    await db_session.commit()
+
+    access_token = jwt_manager.create_access_token({"user_id": user.id})
+
+    img = Image.new("RGB", (100, 100), color="blue")
+    img_bytes = BytesIO()
+    img.save(img_bytes, format="JPEG")
+    img_bytes.seek(0)
+
+    profile_url = f"/api/v1/profiles/users/{user.id}/profile/"
+    headers = {"Authorization": f"Bearer {access_token}"}
+    files = {
+        "first_name": (None, "John"),
+        "last_name": (None, "Doe"),
+        "gender": (None, "man"),
+        "date_of_birth": (None, "1990-01-01"),
+        "info": (None, "This is a test profile."),
+        "avatar": ("avatar.jpg", img_bytes, "image/jpeg"),
+    }
+
+    db_error = OperationalError("SELECT", {}, Exception("Simulated database failure"))
+    with patch.object(AsyncSession, "execute", side_effect=[db_error]):
+        with pytest.raises(OperationalError) as exc_info:
+            await client.post(profile_url, headers=headers, files=files)
+
+    assert exc_info.value is db_error, "The original database error should propagate unchanged!"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_profile_creation_db_error_keeps_existing_profile_avatar(
+        db_session, seed_user_groups, reset_db, jwt_manager, s3_storage_fake, client
+):
+    """
+    Test that resending the avatar of an existing profile, when the lookups then fail with a database
+    error, does not delete the object that the stored profile still references.
+    """
+    user = UserModel.create(email="test@mate.com", raw_password="TestPassword123!", group_id=1)
+    user.is_active = True
+    db_session.add(user)
+    await db_session.commit()
+
+    access_token = jwt_manager.create_access_token({"user_id": user.id})
+
+    img = Image.new("RGB", (100, 100), color="blue")
+    img_bytes = BytesIO()
+    img.save(img_bytes, format="JPEG")
+    avatar_content = img_bytes.getvalue()
+
+    profile_url = f"/api/v1/profiles/users/{user.id}/profile/"
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    def build_files():
+        return {
+            "first_name": (None, "John"),
+            "last_name": (None, "Doe"),
+            "gender": (None, "man"),
+            "date_of_birth": (None, "1990-01-01"),
+            "info": (None, "This is a test profile."),
+            "avatar": ("avatar.jpg", BytesIO(avatar_content), "image/jpeg"),
+        }
+
+    response = await client.post(profile_url, headers=headers, files=build_files())
+    assert response.status_code == 201, f"Expected 201, got {response.status_code}"
+
+    stmt = select(UserProfileModel).where(UserProfileModel.user_id == user.id)
+    result = await db_session.execute(stmt)
+    profile = result.scalars().first()
+    assert profile.avatar in s3_storage_fake.storage, "Avatar of the created profile is missing in storage!"
+
+    db_error = OperationalError("SELECT", {}, Exception("Simulated database failure"))
+    with patch.object(AsyncSession, "execute", side_effect=[db_error]):
+        with pytest.raises(OperationalError):
+            await client.post(profile_url, headers=headers, files=build_files())
+
+    assert s3_storage_fake.storage.get(profile.avatar) == avatar_content, \
+        "Avatar referenced by the existing profile was removed from storage!"
 
 
 @pytest.mark.asyncio
@@ -398,6 +500,9 @@ async def test_cannot_create_profile_twice(
     profiles_count = result_count.scalar_one()
     assert profiles_count == 1, f"Expected only one profile, but found {profiles_count}"
 
+    avatar_key = f"avatars/{user.id}/{hashlib.sha256(img_bytes.getvalue()).hexdigest()[:32]}.jpg"
+    assert avatar_key in s3_storage_fake.storage, "Avatar of the existing profile should not be removed!"
+
 
 @pytest.mark.asyncio
 @pytest.mark.unit
@@ -454,6 +559,69 @@ async def test_profile_creation_fails_on_s3_upload_error(
     assert profile_in_db is None, "Profile should not be created when S3 upload fails!"
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_profile_creation_fails_on_s3_error_response(
+        db_session, seed_user_groups, reset_db, jwt_manager, settings, client
+):
+    """
+    Test that an error response from S3 (e.g. AccessDenied) surfaces as the avatar upload 500.
+
+    Steps:
+    1. Create and activate a user.
+    2. Use a real `S3StorageClient` whose underlying aiobotocore client raises `ClientError` on upload.
+    3. Attempt to create a profile.
+    4. Verify that the request fails with 500 Internal Server Error and the upload error message.
+    """
+    user = UserModel.create(email="test@mate.com", raw_password="TestPassword123!", group_id=1)
+    user.is_active = True
+    db_session.add(user)
+    await db_session.commit()
+
+    access_token = jwt_manager.create_access_token({"user_id": user.id})
+
+    s3_client = S3StorageClient(
+        endpoint_url=settings.S3_STORAGE_ENDPOINT,
+        access_key=settings.S3_STORAGE_ACCESS_KEY,
+        secret_key=settings.S3_STORAGE_SECRET_KEY,
+        bucket_name=settings.S3_BUCKET_NAME
+    )
+    boto_client = AsyncMock()
+    boto_client.upload_fileobj.side_effect = ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "Access Denied"}}, "PutObject"
+    )
+    app.dependency_overrides[get_s3_storage_client] = lambda: s3_client
+
+    img = Image.new("RGB", (100, 100), color="blue")
+    img_bytes = BytesIO()
+    img.save(img_bytes, format="JPEG")
+    img_bytes.seek(0)
+
+    profile_url = f"/api/v1/profiles/users/{user.id}/profile/"
+    headers = {"Authorization": f"Bearer {access_token}"}
+    files = {
+        "first_name": (None, "John"),
+        "last_name": (None, "Doe"),
+        "gender": (None, "man"),
+        "date_of_birth": (None, "1990-01-01"),
+        "info": (None, "This is a test profile."),
+        "avatar": ("avatar.jpg", img_bytes, "image/jpeg"),
+    }
+
+    with patch.object(s3_client, "_get_client", AsyncMock(return_value=boto_client)):
+        response = await client.post(profile_url, headers=headers, files=files)
+
+    assert response.status_code == 500, f"Expected 500, got {response.status_code}"
+    assert response.json()["detail"] == "Failed to upload avatar. Please try again later.", (
+        f"Unexpected error message: {response.json()['detail']}"
+    )
+
+    stmt_profile = select(UserProfileModel).where(UserProfileModel.user_id == user.id)
+    result_profile = await db_session.execute(stmt_profile)
+    profile_in_db = result_profile.scalars().first()
+    assert profile_in_db is None, "Profile should not be created when S3 upload fails!"
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 @pytest.mark.parametrize("first_name, last_name, expected_error", [
@@ -633,3 +801,281 @@ async def test_profile_creation_empty_info(client, jwt_manager, info_value):
     assert response.status_code == 422, f"Expected 422, got {response.status_code}"
     assert "Info field cannot be empty or contain only spaces." in str(response.json()), \
         f"Unexpected error message: {response.json()}"
+
+
+def build_batch_profile_files(user_ids, colors):
+    """
+    Build multipart form data for the batch profile creation endpoint: one set of profile fields
+    and one JPEG avatar per user, in the same order as `user_ids`.
+    """
+    files = []
+    avatars = []
+    for user_id, color in zip(user_ids, colors):
+        img = Image.new("RGB", (100, 100), color=color)
+        img_bytes = BytesIO()
+        img.save(img_bytes, format="JPEG")
+        avatars.append(img_bytes.getvalue())
+
+        files.extend([
+            ("user_id", (None, str(user_id))),
+            ("first_name", (None, "John")),
+            ("last_name", (None, "Doe")),
+            ("gender", (None, "man")),
+            ("date_of_birth", (None, "1990-01-01")),
+            ("info", (None, "Batch profile.")),
+            ("avatar", ("avatar.jpg", img_bytes.getvalue(), "image/jpeg")),
+        ])
+    return files, avatars
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_admin_creates_profiles_in_batch(
+        db_session, seed_user_groups, reset_db, jwt_manager, s3_storage_fake, client
+):
+    """
+    Test that an admin can create profiles for several users in one batch request.
+
+    Steps:
+    1. Create an admin user and two regular users.
+    2. Send a batch request creating profiles for both regular users.
+    3. Verify that both avatars were uploaded and both profiles were created.
+    """
+    admin_user = UserModel.create(email="admin@mate.com", raw_password="AdminPass123!", group_id=3)
+    admin_user.is_active = True
+    user_1 = UserModel.create(email="user1@mate.com", raw_password="User1Pass123!", group_id=1)
+    user_1.is_active = True
+    user_2 = UserModel.create(email="user2@mate.com", raw_password="User2Pass123!", group_id=1)
+    user_2.is_active = True
+    db_session.add_all([admin_user, user_1, user_2])
+    await db_session.commit()
+
+    admin_token = jwt_manager.create_access_token({"user_id": admin_user.id})
+    files, avatars = build_batch_profile_files([user_1.id, user_2.id], ["blue", "red"])
+
+    response = await client.post(
+        "/api/v1/profiles/users/profiles/batch/",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        files=files
+    )
+    assert response.status_code == 201, f"Expected 201, got {response.status_code}"
+
+    response_data = response.json()
+    assert [profile["user_id"] for profile in response_data] == [user_1.id, user_2.id]
+
+    for user, avatar in zip([user_1, user_2], avatars):
+        avatar_key = f"avatars/{user.id}/{hashlib.sha256(avatar).hexdigest()[:32]}.jpg"
+        assert avatar_key in s3_storage_fake.storage, "Avatar file was not uploaded to Fake S3 Storage!"
+
+        stmt_profile = select(UserProfileModel).where(UserProfileModel.user_id == user.id)
+        result_profile = await db_session.execute(stmt_profile)
+        profile_in_db = result_profile.scalars().first()
+        assert profile_in_db, f"Profile for user {user.id} should exist!"
+        assert profile_in_db.first_name == "john", "First name is incorrect!"
+        assert profile_in_db.avatar == avatar_key, "Avatar key in database does not match!"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_regular_user_cannot_create_profiles_in_batch(
+        db_session, seed_user_groups, reset_db, jwt_manager, s3_storage_fake, client
+):
+    """
+    Test that a regular user cannot use the batch profile creation endpoint.
+    """
+    user = UserModel.create(email="user@mate.com", raw_password="UserPass123!", group_id=1)
+    user.is_active = True
+    db_session.add(user)
+    await db_session.commit()
+
+    user_token = jwt_manager.create_access_token({"user_id": user.id})
+    files, _ = build_batch_profile_files([user.id], ["blue"])
+
+    response = await client.post(
+        "/api/v1/profiles/users/profiles/batch/",
+        headers={"Authorization": f"Bearer {user_token}"},
+        files=files
+    )
+    assert response.status_code == 403, f"Expected 403, got {response.status_code}"
+    assert response.json()["detail"] == "You don't have permission to edit these profiles."
+    assert not s3_storage_fake.storage, "No avatar should be uploaded for a rejected batch!"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_batch_profile_creation_is_rejected_if_a_profile_exists(
+        db_session, seed_user_groups, reset_db, jwt_manager, s3_storage_fake, client
+):
+    """
+    Test that a batch fails as a whole when one of the users already has a profile.
+
+    Steps:
+    1. Create an admin user and two regular users, one of them with an existing profile.
+    2. Send a batch request for both regular users.
+    3. Verify that the request fails with 400, no new profile is created and uploaded avatars are removed.
+    """
+    admin_user = UserModel.create(email="admin@mate.com", raw_password="AdminPass123!", group_id=3)
+    admin_user.is_active = True
+    user_1 = UserModel.create(email="user1@mate.com", raw_password="User1Pass123!", group_id=1)
+    user_1.is_active = True
+    user_2 = UserModel.create(email="user2@mate.com", raw_password="User2Pass123!", group_id=1)
+    user_2.is_active = True
+    db_session.add_all([admin_user, user_1, user_2])
+    await db_session.commit()
+
+    db_session.add(UserProfileModel(user_id=user_2.id, first_name="jane", avatar="avatars/existing.jpg"))
+    await db_session.commit()
+
+    admin_token = jwt_manager.create_access_token({"user_id": admin_user.id})
+    files, _ = build_batch_profile_files([user_1.id, user_2.id], ["blue", "red"])
+
+    response = await client.post(
+        "/api/v1/profiles/users/profiles/batch/",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        files=files
+    )
+    assert response.status_code == 400, f"Expected 400, got {response.status_code}"
+    assert response.json()["detail"] == f"Users already have a profile: [{user_2.id}]."
+
+    stmt_profile = select(UserProfileModel).where(UserProfileModel.user_id == user_1.id)
+    result_profile = await db_session.execute(stmt_profile)
+    assert result_profile.scalars().first() is None, "Profile should not have been created!"
+    assert not s3_storage_fake.storage, "Avatars uploaded for a rejected batch were not removed!"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_batch_profile_creation_fails_on_s3_upload_error(
+        db_session, seed_user_groups, reset_db, jwt_manager, s3_storage_fake, client
+):
+    """
+    Test that a batch fails with 500 when one avatar upload fails, and no profile is created.
+    """
+    admin_user = UserModel.create(email="admin@mate.com", raw_password="AdminPass123!", group_id=3)
+    admin_user.is_active = True
+    user = UserModel.create(email="user@mate.com", raw_password="UserPass123!", group_id=1)
+    user.is_active = True
+    db_session.add_all([admin_user, user])
+    await db_session.commit()
+
+    admin_token = jwt_manager.create_access_token({"user_id": admin_user.id})
+    files, _ = build_batch_profile_files([user.id], ["blue"])
+
+    with patch.object(s3_storage_fake, "upload_file", side_effect=S3FileUploadError("Simulated S3 failure")):
+        response = await client.post(
+            "/api/v1/profiles/users/profiles/batch/",
+            headers={"Authorization": f"Bearer {admin_token}"},
+            files=files
+        )
+
+    assert response.status_code == 500, f"Expected 500, got {response.status_code}"
+    assert response.json()["detail"] == "Failed to upload avatars. Please try again later."
+
+    stmt_profile = select(UserProfileModel).where(UserProfileModel.user_id == user.id)
+    result_profile = await db_session.execute(stmt_profile)
+    assert result_profile.scalars().first() is None, "Profile should not be created when S3 upload fails!"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_batch_profile_creation_rejects_oversized_batch(client, jwt_manager):
+    """
+    Test that a batch with more than MAX_BATCH_SIZE profiles is rejected with 422 before any
+    profile in it is validated.
+    """
+    access_token = jwt_manager.create_access_token({"user_id": 1})
+    user_ids = list(range(1, MAX_BATCH_SIZE + 2))
+    files, _ = build_batch_profile_files(user_ids, ["blue"] * len(user_ids))
+
+    with patch.object(ProfileCreateRequestSchema, "from_values", new_callable=AsyncMock) as from_values:
+        response = await client.post(
+            "/api/v1/profiles/users/profiles/batch/",
+            headers={"Authorization": f"Bearer {access_token}"},
+            files=files
+        )
+
+    assert response.status_code == 422, f"Expected 422, got {response.status_code}"
+    assert response.json()["detail"] == f"A batch can contain at most {MAX_BATCH_SIZE} profiles.", \
+        f"Unexpected error message: {response.json()}"
+    from_values.assert_not_called()
+
+
+@pytest.mark.unit
+def test_profile_schema_direct_construction_validates_and_normalises():
+    """
+    Test that constructing ProfileCreateRequestSchema directly runs the same checks and normalisation
+    as the form path: names are lower-cased, info is stripped and invalid values are rejected.
+    """
+    img = Image.new("RGB", (100, 100), color="blue")
+    img_bytes = BytesIO()
+    img.save(img_bytes, format="PNG")
+    img_bytes.seek(0)
+    avatar = UploadFile(img_bytes, filename="avatar.png", size=len(img_bytes.getvalue()))
+
+    profile = ProfileCreateRequestSchema(
+        first_name="John",
+        last_name="Doe",
+        gender="man",
+        date_of_birth=date(1990, 1, 1),
+        info="  This is a test profile.  ",
+        avatar=avatar
+    )
+    assert profile.first_name == "john", "First name should be lower-cased!"
+    assert profile.last_name == "doe", "Last name should be lower-cased!"
+    assert profile.info == "This is a test profile.", "Info should be stripped!"
+
+    with pytest.raises(ValidationError, match="John1 contains non-english letters"):
+        ProfileCreateRequestSchema(
+            first_name="John1",
+            last_name="Doe",
+            gender="man",
+            date_of_birth=date(1990, 1, 1),
+            info="This is a test profile.",
+            avatar=avatar
+        )
+
+    with pytest.raises(ValidationError, match="Invalid image format"):
+        ProfileCreateRequestSchema(
+            first_name="John",
+            last_name="Doe",
+            gender="man",
+            date_of_birth=date(1990, 1, 1),
+            info="This is a test profile.",
+            avatar=UploadFile(BytesIO(b"fake_image"), filename="avatar.png", size=10)
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_lifespan_shares_and_closes_s3_storage_client():
+    """
+    Test that the application lifespan creates one S3 storage client that every request receives,
+    and closes it on shutdown.
+    """
+    storage_client = AsyncMock(spec=S3StorageClient)
+
+    with patch("main.create_s3_storage_client", return_value=storage_client) as create_client:
+        async with lifespan(app):
+            first = get_s3_storage_client(Request({"type": "http", "app": app}))
+            second = get_s3_storage_client(Request({"type": "http", "app": app}))
+            storage_client.close.assert_not_awaited()
+
+    assert first is second is storage_client, "Requests did not share the lifespan S3 client!"
+    create_client.assert_called_once()
+    storage_client.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_lifespan_closes_s3_storage_client_on_error():
+    """
+    Test that the S3 storage client is closed even when the application exits with an error.
+    """
+    storage_client = AsyncMock(spec=S3StorageClient)
+
+    with patch("main.create_s3_storage_client", return_value=storage_client):
+        with pytest.raises(RuntimeError):
+            async with lifespan(app):
+                raise RuntimeError("Simulated application failure")
+
+    storage_client.close.assert_awaited_once()
@@ -1,9 +1,9 @@
+import os
 import re
 from datetime import date
-from io import BytesIO
+from typing import BinaryIO, Optional
 
 from PIL import Image
-from fastapi import UploadFile
 
 from database.models.accounts import GenderEnum
 
@@ -13,22 +13,26 @@ def validate_name(name: str):
         raise ValueError(f'{name} contains non-english letters')
 
 
-def validate_image(avatar: UploadFile) -> None:
+def validate_image(image_file: BinaryIO, size: Optional[int] = None) -> None:
     supported_image_formats = ["JPG", "JPEG", "PNG"]
     max_file_size = 1 * 1024 * 1024
 
-    contents = avatar.file.read()
-    if len(contents) > max_file_size:
+    if size is None:
+        size = image_file.seek(0, os.SEEK_END)
+    if size > max_file_size:
         raise ValueError("Image size exceeds 1 MB")
 
     try:
-        image = Image.open(BytesIO(contents))
-        avatar.file.seek(0)
+        image_file.seek(0)
+        image = Image.open(image_file)
         image_format = image.format
-        if image_format not in supported_image_formats:
-            raise ValueError(f"Unsupported image format: {image_format}. Use one of next: {supported_image_formats}")
     except IOError:
         raise ValueError("Invalid image format")
+    finally:
+        image_file.seek(0)
+
+    if image_format not in supported_image_formats:
+        raise ValueError(f"Unsupported image format: {image_format}. Use one of next: {supported_image_formats}")
 
 
 def validate_gender(gender: str) -> None:
@@ -36,6 +40,11 @@ def validate_gender(gender: str) -> None:
         raise ValueError(f"Gender must be one of: {', '.join(g.value for g in GenderEnum)}")
 
 
+def validate_info(info: str) -> None:
+    if not info.strip():
+        raise ValueError("Info field cannot be empty or contain only spaces.")
+
+
 def validate_birth_date(birth_date: date) -> None:
     if birth_date.year < 1900:
         raise ValueError('Invalid birth date - year must be greater than 1900.')